@@ -81,17 +81,30 @@ class BaseNode(with_metaclass(abc.ABCMeta, json_utils.Jsonable)):
     Returns:
       node id.
     """
-    node_class_name = self.__class__.__name__
-    if self._instance_name:
-      return '{}.{}'.format(node_class_name, self._instance_name)
-    else:
-      return node_class_name
+    node_id = getattr(self, '_id', None)
+    if node_id is None:
+      node_class_name = self.__class__.__name__
+      if self._instance_name:
+        node_id = '{}.{}'.format(node_class_name, self._instance_name)
+      else:
+        node_id = node_class_name
+      # Memoized since class name and instance name never change after
+      # construction. Computed lazily instead of in __init__ because json
+      # deserialization restores nodes without invoking __init__.
+      self._id = node_id
+    return node_id
 
   @property
   @deprecation.deprecated(None, 'component_id is deprecated, use id instead')
   def component_id(self) -> Text:
     return self.id
 
+  def to_json_dict(self) -> Dict[Text, Any]:
+    """Convert from an object to a JSON serializable dictionary."""
+    # The memoized id is derived state; keep it out of the payload so the
+    # serialized form does not depend on whether `id` was accessed first.
+    return {k: v for k, v in self.__dict__.items() if k != '_id'}
+
   @property
   @abc.abstractmethod
   def inputs(self) -> node_common._PropertyDictWrapper:
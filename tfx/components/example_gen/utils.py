@@ -87,6 +87,9 @@ def generate_output_split_names(input_config: example_gen_pb2.Input,
       - Missing train and eval split.
   """
   result = []
+  # Detect duplicates while collecting split names so validation fails fast
+  # on the first duplicate instead of materializing a full set afterwards.
+  seen_names = set()
   if output_config.split_config.splits:
     if len(input_config.splits) != 1:
       # If output is specified, then there should only be one input split.
@@ -96,18 +99,22 @@ def generate_output_split_names(input_config: example_gen_pb2.Input,
     for split in output_config.split_config.splits:
       if not split.name or split.hash_buckets <= 0:
         raise RuntimeError('Output split name and hash_buckets are required.')
+      if split.name in seen_names:
+        raise RuntimeError('Duplicated split name {}.'.format(split.name))
+      seen_names.add(split.name)
       result.append(split.name)
   else:
     # If output is not specified, it will have the same split as the input.
     for split in input_config.splits:
       if not split.name or not split.pattern:
         raise RuntimeError('Input split name and pattern are required.')
+      if split.name in seen_names:
+        raise RuntimeError('Duplicated split name {}.'.format(split.name))
+      seen_names.add(split.name)
       result.append(split.name)
 
   if not result:
     raise RuntimeError('ExampleGen splits are missing.')
-  if len(result) != len(set(result)):
-    raise RuntimeError('Duplicated split name {}.'.format(result))
   # TODO(jyzhao): support custom split for downstream components.
   if not {'train', 'eval'}.issubset(result):
     raise RuntimeError('ExampleGen output splits must contain train and eval.')
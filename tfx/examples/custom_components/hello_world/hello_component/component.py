@@ -0,0 +1,151 @@
+# Copyright 2019 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Example of a TFX custom component which passes its input through.
+
+This component along with other custom component related code will only serve
+as an example and will not be supported by TFX team.
+"""
+import copy
+import functools
+
+from typing import Optional, Text, Tuple
+
+from tfx import types
+from tfx.components.base import base_component
+from tfx.components.base import executor_spec
+from tfx.types import artifact
+from tfx.types import channel_utils
+from tfx.types import standard_artifacts
+from tfx.types.component_spec import ChannelParameter
+from tfx.types.component_spec import ExecutionParameter
+
+# Splits used for the default output channel, as a hashable tuple.
+_DEFAULT_SPLITS = tuple(artifact.DEFAULT_EXAMPLE_SPLITS)
+
+# Prebuilt artifact used as a template for default output artifacts: only
+# the split differs between them, so cloning the template skips re-running
+# the artifact type setup for every split. The clone must be a deep copy
+# because artifacts wrap mutable ml-metadata protos which must not be
+# shared between instances.
+_EXAMPLES_TEMPLATE = standard_artifacts.Examples()
+
+
+@functools.lru_cache(maxsize=None)
+def _default_examples_channel(splits: Tuple[Text, ...]) -> types.Channel:
+  """Builds the default output examples channel for the given splits.
+
+  The artifact construction and channel type inference only depend on the
+  split names, so the result is cached. The returned channel is a shared
+  template: callers must deep-copy its artifacts before handing them to a
+  component instance, since pipeline wiring and drivers mutate artifact
+  state (name, producer_component, uri) in place.
+
+  Args:
+    splits: Tuple of example split names.
+
+  Returns:
+    A static Channel containing one Examples artifact per split.
+  """
+  examples_artifacts = []
+  for split_name in splits:
+    examples = copy.deepcopy(_EXAMPLES_TEMPLATE)
+    examples.split = split_name
+    examples_artifacts.append(examples)
+  return channel_utils.as_channel(examples_artifacts)
+
+
+class HelloComponentSpec(types.ComponentSpec):
+  """ComponentSpec for Custom TFX Hello World Component."""
+
+  # The executor of this component is a pure identity function over its
+  # inputs: the same input artifacts and execution properties always produce
+  # byte-identical outputs. Orchestrators may use this to shortcut execution,
+  # e.g. by substituting input artifact URIs into the output channel instead
+  # of invoking the executor, or by treating an execution-parameter-only
+  # cache match (get_cached_outputs returning {}) as a hit.
+  PURE = True
+
+  PARAMETERS = {
+      'name': ExecutionParameter(type=Text, optional=True),
+  }
+  INPUTS = {
+      'input_data': ChannelParameter(type=standard_artifacts.Examples),
+  }
+  OUTPUTS = {
+      'output_data': ChannelParameter(type=standard_artifacts.Examples),
+  }
+
+
+class _LazyExecutorSpec(object):
+  """Descriptor which resolves the executor spec on first access.
+
+  Importing the executor pulls TensorFlow into the import graph, which is
+  wasted work on parse/compile paths that never run the executor. The first
+  access imports it and replaces this descriptor with the concrete
+  ExecutorClassSpec on the owning class, so later accesses are plain
+  attribute lookups.
+  """
+
+  def __get__(self, obj, owner):
+    from hello_component import executor  # pylint: disable=g-import-not-at-top
+    spec = executor_spec.ExecutorClassSpec(executor.Executor)
+    owner.EXECUTOR_SPEC = spec
+    return spec
+
+
+class HelloComponent(base_component.BaseComponent):
+  """Custom TFX Hello World Component.
+
+  This component reads tf.Examples from the input channel and passes them
+  through unmodified as its output. Since the transformation is the identity,
+  the component advertises itself as pure (see `HelloComponentSpec.PURE`) so
+  orchestrators that understand the contract can reuse cached results instead
+  of re-executing it.
+  """
+
+  SPEC_CLASS = HelloComponentSpec
+  EXECUTOR_SPEC = _LazyExecutorSpec()
+
+  def __init__(self,
+               input_data: types.Channel,
+               output_data: Optional[types.Channel] = None,
+               name: Optional[Text] = None,
+               instance_name: Optional[Text] = None):
+    """Construct a HelloComponent.
+
+    Args:
+      input_data: A Channel of 'ExamplesPath' type, usually produced by an
+        ExampleGen component.
+      output_data: An optional Channel of 'ExamplesPath' type for holding the
+        copied examples; will be created for you if not specified.
+      name: Optional unique name attached to the execution properties.
+      instance_name: Optional unique instance name. Necessary if multiple
+        Hello components are declared in the same pipeline.
+    """
+    if not output_data:
+      # Each instance gets deep copies of the cached template artifacts: a
+      # shallow copy would share the artifact list and its ml-metadata
+      # protos, which pipeline wiring and drivers mutate in place, across
+      # every instance and the process-wide cache.
+      template = _default_examples_channel(_DEFAULT_SPLITS)
+      output_data = channel_utils.as_channel(
+          [copy.deepcopy(examples) for examples in template.get()])
+    spec = HelloComponentSpec(
+        input_data=input_data, output_data=output_data, name=name)
+    super(HelloComponent, self).__init__(
+        spec=spec, instance_name=instance_name)
+    # Mirrors HelloComponentSpec.PURE on the instance so launchers holding a
+    # component can check the identity contract without consulting the spec
+    # class.
+    self._is_identity = True
@@ -0,0 +1,39 @@
+# Copyright 2019 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for hello world component."""
+
+from hello_component import component
+import tensorflow as tf
+from tfx.types import channel_utils
+from tfx.types import standard_artifacts
+
+
+class ComponentTest(tf.test.TestCase):
+
+  def setUp(self):
+    super(ComponentTest, self).setUp()
+    self._input_data = channel_utils.as_channel([
+        standard_artifacts.Examples(split=split)
+        for split in ['train', 'eval']
+    ])
+
+  def testConstruct(self):
+    hello_component = component.HelloComponent(input_data=self._input_data)
+    self.assertEqual('ExamplesPath',
+                     hello_component.outputs['output_data'].type_name)
+    self.assertTrue(component.HelloComponentSpec.PURE)
+
+
+if __name__ == '__main__':
+  tf.test.main()
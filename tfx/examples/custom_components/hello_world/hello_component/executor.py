@@ -0,0 +1,65 @@
+# Copyright 2019 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Example of a TFX custom executor which copies its input to its output.
+
+This executor along with other custom component related code will only serve
+as an example and will not be supported by TFX team.
+"""
+import os
+
+import tensorflow as tf
+from typing import Any, Dict, List, Text
+
+from tfx import types
+from tfx.components.base import base_executor
+from tfx.types import artifact_utils
+from tfx.utils import io_utils
+
+
+class Executor(base_executor.BaseExecutor):
+  """Executor for HelloComponent."""
+
+  def Do(self, input_dict: Dict[Text, List[types.Artifact]],
+         output_dict: Dict[Text, List[types.Artifact]],
+         exec_properties: Dict[Text, Any]) -> None:
+    """Copy the input_data to the output_data.
+
+    For this example that is all that the executor does, which demonstrates
+    the interface expected of a custom executor. The executor is a pure
+    identity function over its inputs.
+
+    Args:
+      input_dict: Input dict from input key to a list of artifacts, including:
+        - input_data: A list of 'ExamplesPath' type which should contain two
+          splits 'train' and 'eval'.
+      output_dict: Output dict from key to a list of artifacts, including:
+        - output_data: A list of 'ExamplesPath' type which should contain two
+          splits 'train' and 'eval'.
+      exec_properties: A dict of execution properties, including:
+        - name: Optional unique name. Necessary if multiple Hello components
+          are declared in the same pipeline.
+
+    Returns:
+      None
+    """
+    self._log_startup(input_dict, output_dict, exec_properties)
+
+    for input_artifact in input_dict['input_data']:
+      input_dir = input_artifact.uri
+      output_dir = artifact_utils.get_split_uri(output_dict['output_data'],
+                                                input_artifact.split)
+      for filename in tf.gfile.ListDirectory(input_dir):
+        io_utils.copy_file(
+            os.path.join(input_dir, filename),
+            os.path.join(output_dir, filename))
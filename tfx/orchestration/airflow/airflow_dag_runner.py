@@ -52,6 +52,8 @@ class AirflowDagRunner(tfx_runner.TfxRunner):
       An Airflow DAG.
     """
 
+    self._prewarm_launch_cache(tfx_pipeline)
+
     # Merge airflow-specific configs with pipeline args
     airflow_dag = models.DAG(
         dag_id=tfx_pipeline.pipeline_info.pipeline_name, **self._config)
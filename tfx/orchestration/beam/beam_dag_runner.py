@@ -112,6 +112,8 @@ class BeamDagRunner(tfx_runner.TfxRunner):
 
     tfx_pipeline.pipeline_info.run_id = datetime.datetime.now().isoformat()
 
+    self._prewarm_launch_cache(tfx_pipeline)
+
     with beam.Pipeline(argv=self._beam_orchestrator_args) as p:
       # Uses for triggering the component DoFns.
       root = p | 'CreateRoot' >> beam.Create([None])
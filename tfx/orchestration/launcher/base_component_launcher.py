@@ -34,6 +34,14 @@ from tfx.orchestration import publisher
 class BaseComponentLauncher(with_metaclass(abc.ABCMeta, object)):
   """Responsible for launching driver, executor and publisher of component."""
 
+  # Optional declaration of the executor spec types this launcher can launch.
+  # When a launcher sets this to a tuple of executor_spec.ExecutorSpec
+  # subclasses, `TfxRunner` indexes launchers by executor spec type so that
+  # component resolution becomes a dict lookup instead of probing every
+  # launcher through `can_launch`. The declaration must agree with
+  # `can_launch`, which remains the source of truth.
+  SUPPORTED_EXECUTOR_SPEC_TYPES = None
+
   def __init__(self, component: base_node.BaseNode,
                pipeline_info: data_types.PipelineInfo,
                driver_args: data_types.DriverArgs,
@@ -31,6 +31,8 @@ from tfx.orchestration.launcher import container_common
 class DockerComponentLauncher(base_component_launcher.BaseComponentLauncher):
   """Responsible for launching a container executor."""
 
+  SUPPORTED_EXECUTOR_SPEC_TYPES = (executor_spec.ExecutorContainerSpec,)
+
   @classmethod
   def can_launch(cls,
                  component_executor_spec: executor_spec.ExecutorSpec) -> bool:
@@ -34,6 +34,8 @@ class InProcessComponentLauncher(base_component_launcher.BaseComponentLauncher):
   component, i.e. its driver and publisher.
   """
 
+  SUPPORTED_EXECUTOR_SPEC_TYPES = (executor_spec.ExecutorClassSpec,)
+
   @classmethod
   def can_launch(cls,
                  component_executor_spec: executor_spec.ExecutorSpec) -> bool:
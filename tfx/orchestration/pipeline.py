@@ -176,10 +176,11 @@ class Pipeline(object):
     # Fills in producer map.
     for component in deduped_components:
       # Guarantees every component of a component type has unique component_id.
-      if component.id in instances_per_component_type[component.type]:
+      instances = instances_per_component_type[component.type]
+      if component.id in instances:
         raise RuntimeError('Duplicated component_id %s for component type %s' %
                            (component.id, component.type))
-      instances_per_component_type[component.type].add(component.id)
+      instances.add(component.id)
       for key, output_channel in component.outputs.get_all().items():
         assert not producer_map.get(
             output_channel), '{} produced more than once'.format(output_channel)
@@ -193,9 +194,10 @@ class Pipeline(object):
     # Connects nodes based on producer map.
     for component in deduped_components:
       for i in component.inputs.get_all().values():
-        if producer_map.get(i):
-          component.add_upstream_node(producer_map[i])
-          producer_map[i].add_downstream_node(component)
+        producer = producer_map.get(i)
+        if producer:
+          component.add_upstream_node(producer)
+          producer.add_downstream_node(component)
 
     self._components = []
     visited = set()
@@ -13,21 +13,54 @@
 # limitations under the License.
 """Definition of TFX runner base class."""
 
-from __future__ import absolute_import
-from __future__ import division
-from __future__ import print_function
-from __future__ import unicode_literals
-
 import abc
-from six import with_metaclass
-from typing import Any, Optional, Type
+import functools
+from typing import Any, Dict, Optional, Tuple, Type
 
 from tfx.components.base import base_component
 from tfx.orchestration.launcher import base_component_launcher
 from tfx.utils import abc_utils
 
-
-class TfxRunner(with_metaclass(abc.ABCMeta, object)):
+# Sentinel default for the per-subclass validation cache. None cannot be the
+# default: SUPPORTED_LAUNCHER_CLASSES = None is itself a misconfiguration
+# validation must catch, and a None default would make the cache look
+# up-to-date for exactly that case.
+_UNVALIDATED = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_launcher_class(
+    supported_launcher_classes: Tuple[
+        Type[base_component_launcher.BaseComponentLauncher], ...],
+    executor_spec_type: type
+) -> Optional[Type[base_component_launcher.BaseComponentLauncher]]:
+  """Resolves a launcher class purely from declared executor spec types.
+
+  The cache key consists of types only, so results are shared across runner
+  instances and the LRU bound keeps long-running orchestrator processes from
+  growing the cache without limit.
+
+  Args:
+    supported_launcher_classes: launcher classes in precedence order.
+    executor_spec_type: type of the component's executor spec.
+
+  Returns:
+    The first launcher class declaring support for the executor spec type,
+    or None when resolution needs the executor spec instance (a launcher
+    without SUPPORTED_EXECUTOR_SPEC_TYPES precedes any declared match).
+  """
+  for launcher_class in supported_launcher_classes:
+    supported_spec_types = launcher_class.SUPPORTED_EXECUTOR_SPEC_TYPES
+    if supported_spec_types is None:
+      # This launcher can only be probed through can_launch with a spec
+      # instance; deciding from types alone could violate precedence.
+      return None
+    if issubclass(executor_spec_type, tuple(supported_spec_types)):
+      return launcher_class
+  return None
+
+
+class TfxRunner(abc.ABC):
   """Base runner class for TFX.
 
   This is the base class for every TFX runner.
@@ -44,20 +77,49 @@ class TfxRunner(with_metaclass(abc.ABCMeta, object)):
   def __init__(self):
     """Initializes a TfxRunner instance.
     """
-    self._supported_launcher_classes = self.__class__.SUPPORTED_LAUNCHER_CLASSES
-    self._validate_supported_launcher_classes()
+    # Freeze into a tuple so launcher ordering is immutable for the lifetime
+    # of the runner. The tuple order determines launcher precedence; the
+    # frozenset alongside it exists purely for O(1) membership tests by
+    # subclasses overriding find_component_launcher_class.
+    self._supported_launcher_classes = tuple(
+        self.__class__.SUPPORTED_LAUNCHER_CLASSES or ())
+    self._supported_launcher_set = frozenset(self._supported_launcher_classes)
+    # Validation is deferred to the first launcher resolution so that
+    # compile/plan-only paths which construct a runner but never launch a
+    # component do no validation work at all.
+    self._launcher_classes_validated = False
+    # Cache of launcher lookup results keyed by the type of the component's
+    # executor_spec. `can_launch` only depends on the executor spec type, and
+    # the supported launcher classes are fixed for the lifetime of the runner,
+    # so cached results never go stale.
+    self._launcher_cache = {
+    }  # type: Dict[type, Type[base_component_launcher.BaseComponentLauncher]]
 
   def _validate_supported_launcher_classes(self):
     if not self._supported_launcher_classes:
       raise ValueError('component_launcher_classes must not be None or empty.')
 
-    if any([
+    if any(
         not issubclass(cls, base_component_launcher.BaseComponentLauncher)
-        for cls in self._supported_launcher_classes
-    ]):
+        for cls in self._supported_launcher_classes):
       raise TypeError('Each item in supported_launcher_classes must be type of '
                       'base_component_launcher.BaseComponentLauncher.')
 
+  def _prewarm_launch_cache(self, pipeline) -> None:
+    """Hook to batch-prime caches before the per-component launch loop.
+
+    Runners call this once at the beginning of `run`. The default
+    implementation is a no-op. Runners backed by ML metadata can override it
+    to fetch the pipeline's historical executions with a single paginated
+    query (instead of one round-trip per component) and populate a shared
+    cache mapping execution cache signatures to published outputs, which
+    per-component drivers then consult locally.
+
+    Args:
+      pipeline: logical TFX pipeline definition about to be run.
+    """
+    pass
+
   def find_component_launcher_class(
       self, component: base_component.BaseComponent
   ) -> Type[base_component_launcher.BaseComponentLauncher]:
@@ -65,7 +127,9 @@ class TfxRunner(with_metaclass(abc.ABCMeta, object)):
 
     The default lookup logic goes through the self._supported_launcher_classes
     in order and returns the first one which can launch the executor_spec of
-    the component. Subclass may customize the logic by overriding the method.
+    the component. Results are memoized by executor spec type so that repeated
+    resolutions hit a dict lookup instead of re-probing every launcher.
+    Subclass may customize the logic by overriding the method.
 
     Args:
       component: the component to launch.
@@ -75,9 +139,37 @@ class TfxRunner(with_metaclass(abc.ABCMeta, object)):
 
     Raises:
       RuntimeError: if no supported launcher is found.
+      ValueError: if SUPPORTED_LAUNCHER_CLASSES is None or empty; validation
+        runs lazily on the first resolution.
+      TypeError: if SUPPORTED_LAUNCHER_CLASSES contains a class which is not
+        a BaseComponentLauncher.
     """
+    # Cheap double-checked laziness: the instance flag skips the per-subclass
+    # check on the hot path, and validating twice under a race is harmless.
+    if not self._launcher_classes_validated:
+      cls = self.__class__
+      # Validation only depends on SUPPORTED_LAUNCHER_CLASSES, which is a
+      # class property, so it runs once per subclass instead of per instance.
+      if (getattr(cls, '_validated_launcher_classes', _UNVALIDATED) is not
+          cls.SUPPORTED_LAUNCHER_CLASSES):
+        self._validate_supported_launcher_classes()
+        cls._validated_launcher_classes = cls.SUPPORTED_LAUNCHER_CLASSES
+      self._launcher_classes_validated = True
+    component_executor_spec = component.executor_spec
+    executor_spec_type = type(component_executor_spec)
+    launcher_class = _resolve_launcher_class(self._supported_launcher_classes,
+                                             executor_spec_type)
+    if launcher_class is not None:
+      return launcher_class
+    # Fallback for launchers which do not declare their supported executor
+    # spec types: probe can_launch with the spec instance, memoized per
+    # runner since the probe may depend on instance state.
+    cached_launcher_class = self._launcher_cache.get(executor_spec_type)
+    if cached_launcher_class is not None:
+      return cached_launcher_class
     for component_launcher_class in self._supported_launcher_classes:
-      if component_launcher_class.can_launch(component.executor_spec):
+      if component_launcher_class.can_launch(component_executor_spec):
+        self._launcher_cache[executor_spec_type] = component_launcher_class
         return component_launcher_class
     raise RuntimeError('No launcher can launch component "%s".' %
                        component.component_id)
@@ -0,0 +1,54 @@
+# Copyright 2019 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for tfx.orchestration.tfx_runner."""
+
+import mock
+import tensorflow as tf
+
+from tfx.orchestration import tfx_runner
+
+
+class _NoneLauncherClassesRunner(tfx_runner.TfxRunner):
+
+  SUPPORTED_LAUNCHER_CLASSES = None
+
+  def run(self, pipeline):
+    pass
+
+
+class _EmptyLauncherClassesRunner(tfx_runner.TfxRunner):
+
+  SUPPORTED_LAUNCHER_CLASSES = []
+
+  def run(self, pipeline):
+    pass
+
+
+class TfxRunnerTest(tf.test.TestCase):
+
+  def testNoneLauncherClassesRaisesOnFirstResolution(self):
+    # Validation is deferred: construction must succeed and the first
+    # launcher resolution must raise.
+    runner = _NoneLauncherClassesRunner()
+    with self.assertRaises(ValueError):
+      runner.find_component_launcher_class(mock.Mock())
+
+  def testEmptyLauncherClassesRaisesOnFirstResolution(self):
+    runner = _EmptyLauncherClassesRunner()
+    with self.assertRaises(ValueError):
+      runner.find_component_launcher_class(mock.Mock())
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -0,0 +1,177 @@
+# Copyright 2019 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""BuildSpec helper class."""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+import yaml
+from typing import Any, Dict, Optional, Text
+
+from tfx.tools.cli.container_builder import labels
+
+# Prefer libyaml's C implementation when it is available; it is roughly an
+# order of magnitude faster than the pure-Python loader on both parse and
+# emit.
+try:
+  from yaml import CSafeLoader as _YamlLoader  # pylint: disable=g-import-not-at-top
+  from yaml import CSafeDumper as _YamlDumper  # pylint: disable=g-import-not-at-top
+except ImportError:
+  from yaml import SafeLoader as _YamlLoader  # pylint: disable=g-import-not-at-top
+  from yaml import SafeDumper as _YamlDumper  # pylint: disable=g-import-not-at-top
+
+# Informational messages are off by default and, when enabled, go straight
+# to stderr: click.echo would probe the TTY and flush on every call, which
+# adds up in tight CLI loops.
+_VERBOSE = os.environ.get('TFX_CLI_VERBOSE')
+
+
+def _echo(message: Text):
+  """Writes an informational message to stderr when verbose mode is on."""
+  if _VERBOSE:
+    sys.stderr.write(message + '\n')
+
+
+class BuildSpec(object):
+  """Build specification.
+
+  BuildSpec reads the build spec file if it exists, otherwise generates a
+  default one. An existing file is only read, not parsed, at construction
+  time: the YAML document is materialized and validated lazily on first
+  access, so CLI paths that merely probe for the spec never pay for building
+  the nested dicts.
+
+  Attributes:
+    filename: build spec filename.
+    build_context: local directory to be used as the docker build context.
+    target_image: the target image path to be built.
+  """
+
+  __slots__ = ('filename', '_build_context', '_target_image', '_buildspec',
+               '_raw_buildspec')
+
+  def __init__(self,
+               filename: Text = labels.BUILD_SPEC_FILENAME,
+               target_image: Optional[Text] = None,
+               build_context: Text = labels.BUILD_CONTEXT,
+               dockerfile_name: Text = labels.DOCKERFILE_NAME):
+    self.filename = filename
+    self._build_context = build_context
+    self._target_image = target_image
+    self._buildspec = None
+    self._raw_buildspec = None
+    # Open directly instead of probing with os.path.exists first: the common
+    # spec-exists path costs one syscall instead of two, and there is no
+    # window for the file to disappear between the check and the open.
+    try:
+      spec_file = open(self.filename, 'r')
+    except FileNotFoundError:
+      if target_image is None:
+        raise ValueError('BuildSpec requires a target_image to generate a '
+                         'default build spec.')
+      self._generate_default(dockerfile_name)
+      return
+    with spec_file:
+      self._read_existing_build_spec(spec_file)
+
+  @property
+  def buildspec(self) -> Dict[Text, Any]:
+    """In-memory representation of the build spec, parsed on first access."""
+    if self._buildspec is None and self._raw_buildspec is not None:
+      self._parse_build_spec()
+    return self._buildspec
+
+  @property
+  def build_context(self) -> Text:
+    if self._buildspec is None and self._raw_buildspec is not None:
+      self._parse_build_spec()
+    return self._build_context
+
+  @property
+  def target_image(self) -> Optional[Text]:
+    if self._buildspec is None and self._raw_buildspec is not None:
+      self._parse_build_spec()
+    return self._target_image
+
+  def _read_existing_build_spec(self, spec_file):
+    """Read an existing build spec yaml from an open file, deferring the parse."""
+    _echo('Reading build spec from %s' % self.filename)
+    if self._target_image is not None:
+      _echo('Target image %s is not used. If the build spec is '
+            'provided, update the target image in the build spec '
+            'file %s.' % (self._target_image, self.filename))
+    self._raw_buildspec = spec_file.read()
+
+  def _parse_build_spec(self):
+    """Materialize and validate the deferred build spec document."""
+    buildspec = yaml.load(self._raw_buildspec, Loader=_YamlLoader)
+    if len(buildspec['build']['artifacts']) != 1:
+      raise RuntimeError('The build spec contains multiple artifacts '
+                         'however only one is supported.')
+    artifact = buildspec['build']['artifacts'][0]
+    self._target_image = artifact['image']
+    self._build_context = artifact.get('workspace', labels.BUILD_CONTEXT)
+    self._buildspec = buildspec
+
+  def _generate_default(self, dockerfile_name: Text):
+    """Generate a default build spec yaml."""
+    self._buildspec = {
+        'apiVersion': labels.SKAFFOLD_API_VERSION,
+        'kind': 'Config',
+        'build': {
+            'artifacts': [{
+                'image': self._target_image,
+                'workspace': self._build_context,
+                'docker': {
+                    'dockerfile': dockerfile_name
+                }
+            }]
+        }
+    }
+    serialized = yaml.dump(self._buildspec, Dumper=_YamlDumper).encode('utf-8')
+    # Skip the write when the on-disk spec is already byte-identical so that
+    # warm rebuilds do not touch the file and invalidate downstream
+    # skaffold/docker caches keyed on its mtime.
+    try:
+      with open(self.filename, 'rb') as f:
+        if _content_digest(f.read()) == _content_digest(serialized):
+          return
+    except FileNotFoundError:
+      pass
+    # Write atomically so a concurrent reader never observes a partial spec.
+    dirname = os.path.dirname(os.path.abspath(self.filename))
+    tmp_file = tempfile.NamedTemporaryFile(mode='wb', dir=dirname, delete=False)
+    try:
+      with tmp_file:
+        tmp_file.write(serialized)
+      # NamedTemporaryFile creates files with mode 0600; the build spec is a
+      # user-facing project file, so restore the umask-based permissions a
+      # plain open() would have used.
+      umask = os.umask(0)
+      os.umask(umask)
+      os.chmod(tmp_file.name, 0o666 & ~umask)
+      os.replace(tmp_file.name, self.filename)
+    except Exception:
+      try:
+        os.unlink(tmp_file.name)
+      except OSError:
+        pass
+      raise
+
+
+def _content_digest(content: bytes) -> bytes:
+  """Returns a short digest used to compare build spec contents."""
+  return hashlib.blake2b(content, digest_size=16).digest()
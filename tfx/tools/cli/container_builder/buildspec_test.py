@@ -0,0 +1,81 @@
+# Copyright 2019 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for tfx.tools.cli.container_builder.buildspec."""
+
+import os
+
+import tensorflow as tf
+import yaml
+
+from tfx.tools.cli.container_builder import buildspec
+from tfx.tools.cli.container_builder import labels
+
+_TEST_TARGET_IMAGE = 'gcr.io/test/myimage'
+
+
+class BuildSpecTest(tf.test.TestCase):
+
+  def setUp(self):
+    super(BuildSpecTest, self).setUp()
+    self._buildspec_path = os.path.join(self.get_temp_dir(), 'build.yaml')
+
+  def testGenerateDefault(self):
+    build_spec = buildspec.BuildSpec(
+        filename=self._buildspec_path, target_image=_TEST_TARGET_IMAGE)
+    self.assertTrue(os.path.exists(self._buildspec_path))
+    self.assertEqual(_TEST_TARGET_IMAGE, build_spec.target_image)
+    self.assertEqual(labels.BUILD_CONTEXT, build_spec.build_context)
+    with open(self._buildspec_path) as f:
+      spec = yaml.safe_load(f)
+    artifact = spec['build']['artifacts'][0]
+    self.assertEqual(_TEST_TARGET_IMAGE, artifact['image'])
+    self.assertEqual(labels.DOCKERFILE_NAME, artifact['docker']['dockerfile'])
+
+  def testMissingFileWithoutTargetImage(self):
+    with self.assertRaises(ValueError):
+      buildspec.BuildSpec(filename=self._buildspec_path)
+
+  def testReadExisting(self):
+    buildspec.BuildSpec(
+        filename=self._buildspec_path, target_image=_TEST_TARGET_IMAGE)
+    build_spec = buildspec.BuildSpec(filename=self._buildspec_path)
+    self.assertEqual(_TEST_TARGET_IMAGE, build_spec.target_image)
+    self.assertEqual(labels.BUILD_CONTEXT, build_spec.build_context)
+    self.assertEqual(_TEST_TARGET_IMAGE,
+                     build_spec.buildspec['build']['artifacts'][0]['image'])
+
+  def testSkipWriteWhenContentUnchanged(self):
+    build_spec = buildspec.BuildSpec(
+        filename=self._buildspec_path, target_image=_TEST_TARGET_IMAGE)
+    mtime = os.stat(self._buildspec_path).st_mtime_ns
+    # Regenerating an identical spec must leave the file untouched so
+    # mtime-based caches downstream stay warm.
+    build_spec._generate_default(labels.DOCKERFILE_NAME)
+    self.assertEqual(mtime, os.stat(self._buildspec_path).st_mtime_ns)
+
+  def testMultipleArtifactsRaisesOnFirstAccess(self):
+    with open(self._buildspec_path, 'w') as f:
+      f.write('build:\n'
+              '  artifacts:\n'
+              '  - image: gcr.io/test/a\n'
+              '  - image: gcr.io/test/b\n')
+    # Parsing is deferred, so construction succeeds and validation raises on
+    # the first property access.
+    build_spec = buildspec.BuildSpec(filename=self._buildspec_path)
+    with self.assertRaises(RuntimeError):
+      _ = build_spec.target_image
+
+
+if __name__ == '__main__':
+  tf.test.main()